@@ -18,24 +18,294 @@ Usage:
     
     # Or run only TypeScript version
     python scripts/evaluate_mcp.py --ts-only
+    
+    # Keep servers warm between runs (background daemon, 5 min idle timeout)
+    python scripts/evaluate_mcp.py --daemon
+    
+    # Reuse tool results from earlier runs for up to an hour (--max-age seconds)
+    python scripts/evaluate_mcp.py --cache-dir /tmp/evaluate_mcp_cache --max-age 3600
+    
+    # Allow slower responses and fewer concurrent Bitbucket calls
+    python scripts/evaluate_mcp.py --timeout 300 --max-parallel 2
 """
 
+import asyncio
+import collections
+import contextlib
+import hashlib
+import io
+import itertools
 import json
-import subprocess
 import sys
 import os
+import stat
+import subprocess
+import tempfile
+import time
 import argparse
-from typing import Any, Optional
+from typing import AbstractSet, Any, Optional, Sequence, Union
 from dataclasses import dataclass, field
 from pathlib import Path
 
-# MCP JSON-RPC message IDs
-_message_id = 0
+# Fast JSON codec when available; both variants produce and accept bytes
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    orjson = None
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    def _loads(data: Any) -> Any:
+        return json.loads(bytes(data) if isinstance(data, memoryview) else data)
+
+# Optional streaming parser for summarising very large payloads
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Constant JSON-RPC frames, encoded once; only the request id varies
+_INIT_TEMPLATE = (
+    b'{"jsonrpc":"2.0","id":%d,"method":"initialize","params":{'
+    b'"protocolVersion":"2024-11-05","capabilities":{},'
+    b'"clientInfo":{"name":"evaluate_mcp","version":"1.0.0"}}}\n'
+)
+_INITIALIZED_FRAME = b'{"jsonrpc":"2.0","method":"notifications/initialized","params":{}}\n'
+_TOOLS_LIST_TEMPLATE = b'{"jsonrpc":"2.0","id":%d,"method":"tools/list","params":{}}\n'
+
+# MCP JSON-RPC message IDs; count.__next__ is a single C call, so ids stay
+# unique even with concurrent requests
+_next_id = itertools.count(1).__next__
+
+# Seconds to wait for each response, counted once the request has been written.
+# Requests are pipelined (see MAX_CONCURRENT), and the Python server handles its
+# tool calls one at a time, so a request's wait can include the Bitbucket calls
+# queued ahead of it, each bounded by the servers' own API_TIMEOUT (default 30)
+# plus rate-limit backoff. The default allows for a full queue of such calls;
+# raise it along with API_TIMEOUT.
+REQUEST_TIMEOUT = 120
+
+# Maximum tools/call requests in flight per server during a batch
+MAX_CONCURRENT = 4
+
+# Maximum requests in flight across all servers; both servers share the same
+# Bitbucket account and therefore its rate limit. Kept below twice MAX_CONCURRENT
+# so that it, not the per-server caps, bounds a comparison run.
+GLOBAL_MAX_PARALLEL = 6
+
+# Stream buffer limit, i.e. the longest line readline() accepts: server stderr
+# lines and requests relayed by the daemon. asyncio defaults to 64 KiB. Responses
+# are split by _read_responses itself and are not bound by it.
+READ_LIMIT = 16 * 1024 * 1024
+
+# Bytes requested per read from a server's stdout
+READ_CHUNK = 256 * 1024
+
+# Lines of server stderr retained for post-mortem error messages
+STDERR_TAIL_LINES = 500
+
+# Tool payloads larger than this are summarised by streaming (when ijson is
+# installed) instead of being decoded in full; below it a full decode is faster
+STREAM_THRESHOLD = 1024 * 1024
+
+# Seconds a cached discovery call (e.g. the first list_repositories) stays fresh
+DISCOVERY_TTL = 300
+
+# Only these variables (and uv's UV_* settings) are inherited by server
+# subprocesses, on top of the Bitbucket credentials passed in explicitly. The
+# proxy and CA variables keep both servers' Bitbucket HTTP calls working behind
+# a corporate proxy or custom certificate authority.
+_INHERITED_ENV = frozenset({
+    "PATH", "HOME", "LANG", "TMPDIR",
+    "HTTPS_PROXY", "HTTP_PROXY", "NO_PROXY", "https_proxy", "http_proxy", "no_proxy",
+    "SSL_CERT_FILE", "SSL_CERT_DIR", "REQUESTS_CA_BUNDLE", "NODE_EXTRA_CA_CERTS",
+    # Needed by node, uv and CPython on Windows
+    "SYSTEMROOT", "APPDATA", "LOCALAPPDATA", "USERPROFILE", "TEMP", "TMP", "PATHEXT", "COMSPEC",
+})
+_BASE_ENV = {k: v for k, v in os.environ.items() if k in _INHERITED_ENV or k.startswith("UV_")}
+
+# Default freshness of --cache-dir entries, in seconds; bump the version
+# variable to invalidate every entry (e.g. in CI)
+CACHE_MAX_AGE = 3600
+CACHE_VERSION = os.environ.get("EVALUATE_MCP_CACHE_VERSION", "1")
+
+# Connection-cache daemon: keeps server subprocesses warm between runs (--daemon)
+DAEMON_IDLE_TIMEOUT = 300
+
+
+def daemon_socket() -> Path:
+    """Per-user socket of the connection-cache daemon (POSIX only, so resolved lazily).
+    
+    Clients send Bitbucket credentials over the socket, so it lives in a
+    directory only the current user can enter: $XDG_RUNTIME_DIR, or a 0700
+    directory under the temp dir. Another user cannot plant a listener there.
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        directory = Path(runtime_dir)
+    else:
+        directory = Path(tempfile.gettempdir()) / f"evaluate_mcp-{os.getuid()}"
+        directory.mkdir(mode=0o700, exist_ok=True)
+    _check_private(directory, stat.S_ISDIR)
+    return directory / "evaluate_mcp.sock"
+
+
+def _check_private(path: Path, is_type) -> None:
+    """Refuse a daemon path that is of the wrong type, not ours, or open to other users"""
+    info = os.lstat(path)
+    if not is_type(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+        raise RuntimeError(f"Refusing to use {path}: it is not private to the current user")
+
+
+@dataclass(frozen=True)
+class TestShape:
+    """Structural summary of a tool result: only what compare_results inspects.
+    
+    Holding on to shapes instead of full results keeps the evaluation's memory
+    flat however many records list_commits or list_pipelines return.
+    """
+    keys: frozenset[str]
+    fields: dict[str, tuple[str, Optional[int]]]  # key -> (type name, list length)
+    error: Any = None
+    
+    @property
+    def has_error(self) -> bool:
+        return "error" in self.keys
+    
+    @classmethod
+    def from_result(cls, result: dict) -> "TestShape":
+        """Reduce a parsed tool result to its shape"""
+        return cls(
+            keys=frozenset(result),
+            fields={
+                key: (type(value).__name__, len(value) if isinstance(value, list) else None)
+                for key, value in result.items()
+            },
+            error=result.get("error"),
+        )
+
+
+# Outcome of one tool call in a batch: its shape, or the exception that call raised
+CallOutcome = Union[TestShape, Exception]
+
+
+def _parse_text(text: str, data: Optional[bytes] = None) -> dict:
+    """Decode a tool's text payload (or its already-encoded bytes) into a result dict"""
+    # Only orjson parses bytes natively; stdlib json would decode them back to str
+    source = data if data is not None and orjson else text
+    try:
+        parsed = _loads(source)
+    except json.JSONDecodeError:
+        return {"raw": text}
+    return parsed if isinstance(parsed, dict) else {"raw": parsed}
+
+
+def _stream_shape(data: bytes) -> Optional[TestShape]:
+    """Build a shape from parser events without materializing nested values.
+    
+    Returns None when the payload is not a JSON object (or not valid JSON), or
+    when it carries an error, so the caller can fall back to a full decode.
+    """
+    types: dict[str, str] = {}
+    lengths: dict[str, int] = {}
+    depth = 0
+    key = None
+    try:
+        for event, value in ijson.basic_parse(io.BytesIO(data), use_float=True):
+            if event in ("end_map", "end_array"):
+                depth -= 1
+                continue
+            if depth == 0 and event != "start_map":
+                return None
+            if depth == 1:
+                if event == "map_key":
+                    key = value
+                    continue
+                # Value of a top-level key
+                if event == "start_array":
+                    types[key] = "list"
+                    lengths[key] = 0
+                else:
+                    types[key] = "dict" if event == "start_map" else type(value).__name__
+                    lengths.pop(key, None)
+            elif depth == 2 and key in lengths and event != "map_key":
+                # First event of a new element of a top-level array
+                lengths[key] += 1
+            if event in ("start_map", "start_array"):
+                depth += 1
+    except ijson.JSONError:
+        return None
+    
+    if "error" in types:
+        return None  # errors are small and their value is reported in full
+    return TestShape(
+        keys=frozenset(types),
+        fields={k: (t, lengths.get(k)) for k, t in types.items()},
+    )
+
+
+def _text_shape(text: str) -> TestShape:
+    """Shape of a tool's text payload, streamed when it is very large"""
+    if ijson and len(text) > STREAM_THRESHOLD:
+        data = text.encode()
+        shape = _stream_shape(data)
+        if shape is not None:
+            return shape
+        return TestShape.from_result(_parse_text(text, data))
+    return TestShape.from_result(_parse_text(text))
+
+
+@dataclass
+class ResultCache:
+    """File-per-key disk cache of tools/call responses, so re-runs skip unchanged tools.
+    
+    Keys combine the server's source fingerprint (newest mtime of its build or
+    sources), the tool name and arguments, the workspace and CACHE_VERSION;
+    rebuilding a server or bumping the version invalidates its entries.
+    """
+    directory: Path
+    max_age: float = CACHE_MAX_AGE
+    namespace: str = ""
+    fingerprints: dict[str, str] = field(default_factory=dict)  # server name -> fingerprint
+    hits: int = 0
+    
+    def __post_init__(self) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+    
+    def _path(self, server: str, tool: str, arguments: dict) -> Path:
+        args = json.dumps(arguments, sort_keys=True)
+        raw = f"{self.fingerprints.get(server, '')}|{server}|{tool}|{args}|{self.namespace}"
+        return self.directory / f"{hashlib.blake2b(raw.encode()).hexdigest()}.json"
+    
+    def get(self, server: str, tool: str, arguments: dict) -> Optional[dict]:
+        """Return a cached response younger than ``max_age`` seconds, if any"""
+        path = self._path(server, tool, arguments)
+        try:
+            if time.time() - path.stat().st_mtime > self.max_age:
+                return None
+            response = _loads(path.read_bytes())
+        except (OSError, ValueError):
+            return None
+        self.hits += 1
+        return response
+    
+    def put(self, server: str, tool: str, arguments: dict, response: dict) -> None:
+        """Store a response; written to a temporary file first so readers never see a partial entry"""
+        path = self._path(server, tool, arguments)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_bytes(_dumps(response))
+        os.replace(tmp, path)
+
 
-def next_id() -> int:
-    global _message_id
-    _message_id += 1
-    return _message_id
+def source_fingerprint(path: Path) -> str:
+    """Newest modification time of a file, or of the Python sources under a directory"""
+    if path.is_dir():
+        return str(max((p.stat().st_mtime_ns for p in path.rglob("*.py")), default=0))
+    return str(path.stat().st_mtime_ns) if path.exists() else ""
 
 
 @dataclass
@@ -44,109 +314,445 @@ class MCPServer:
     name: str
     command: list[str]
     env: dict[str, str]
-    process: Optional[subprocess.Popen] = None
+    cwd: Optional[str] = None
+    timeout: float = REQUEST_TIMEOUT
+    max_concurrent: int = MAX_CONCURRENT
+    limiter: Optional[asyncio.Semaphore] = None  # shared cap across servers, for every request
+    cache: Optional[ResultCache] = None
+    process: Optional[asyncio.subprocess.Process] = None
+    _pending: dict[int, asyncio.Future] = field(default_factory=dict, repr=False)
+    _reader: Optional[asyncio.Task] = field(default=None, repr=False)
+    _stderr_drain: Optional[asyncio.Task] = field(default=None, repr=False)
+    _stderr_tail: collections.deque = field(
+        default_factory=lambda: collections.deque(maxlen=STDERR_TAIL_LINES), repr=False
+    )
+    _closed: Optional[Exception] = field(default=None, repr=False)
+    _tools: Optional[list[dict]] = field(default=None, repr=False)
+    _discovery: dict[tuple, tuple[float, dict]] = field(default_factory=dict, repr=False)
+    _stdin: Optional[asyncio.StreamWriter] = field(default=None, repr=False)
+    _stdout: Optional[asyncio.StreamReader] = field(default=None, repr=False)
+    initialize_result: Optional[dict] = field(default=None, repr=False)
+    
+    def __post_init__(self) -> None:
+        # Shared by every batch on this server, so overlapping batches respect the cap
+        self._slots = asyncio.Semaphore(self.max_concurrent)
     
-    def start(self) -> None:
+    async def start(self) -> None:
         """Start the MCP server process"""
-        full_env = {**os.environ, **self.env}
-        self.process = subprocess.Popen(
-            self.command,
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            env=full_env,
-            text=True,
-            bufsize=1,
+        self.process = await asyncio.create_subprocess_exec(
+            *self.command,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env={**_BASE_ENV, **self.env},
+            cwd=self.cwd,
+            limit=READ_LIMIT,
         )
+        # Keep stderr flowing: a chatty server would otherwise fill the pipe
+        # buffer, block on write and stop answering on stdout
+        self._stderr_tail.clear()
+        self._stderr_drain = asyncio.create_task(self._drain_stderr())
+        await self._connect(self.process.stdout, self.process.stdin)
+    
+    async def _drain_stderr(self) -> None:
+        """Read stderr continuously, keeping the last lines for error reports"""
+        while True:
+            try:
+                line = await self.process.stderr.readline()
+            except ValueError:
+                continue  # over-long line; asyncio has already discarded it
+            if not line:
+                return
+            self._stderr_tail.append(line)
+    
+    async def _stderr_text(self) -> str:
+        """The retained stderr tail, once the drain has caught up with the exit"""
+        if self._stderr_drain:
+            await asyncio.wait([self._stderr_drain], timeout=1)
+        return b"".join(self._stderr_tail).decode(errors="replace")
+    
+    async def _connect(self, stdout: asyncio.StreamReader, stdin: asyncio.StreamWriter) -> None:
+        """Attach to the server's streams and perform the MCP handshake"""
+        self._stdout, self._stdin = stdout, stdin
+        self._closed = None
+        self._reader = asyncio.create_task(self._read_responses())
         # Send initialize request
-        self._send_request("initialize", {
-            "protocolVersion": "2024-11-05",
-            "capabilities": {},
-            "clientInfo": {"name": "evaluate_mcp", "version": "1.0.0"}
-        })
+        msg_id = _next_id()
+        response = await self._send_frame(msg_id, _INIT_TEMPLATE % msg_id, "initialize")
+        if "error" in response:
+            raise RuntimeError(f"Server {self.name} failed to initialize: {response['error']}")
+        self.initialize_result = response.get("result", {})
         # Send initialized notification
-        self._send_notification("notifications/initialized", {})
+        self._stdin.write(_INITIALIZED_FRAME)
+        await self._stdin.drain()
     
-    def stop(self) -> None:
+    async def stop(self) -> None:
         """Stop the MCP server process"""
+        self._tools = None
+        self._discovery.clear()
         if self.process:
-            self.process.terminate()
-            self.process.wait(timeout=5)
+            if self.process.returncode is None:
+                self.process.terminate()
+            try:
+                await asyncio.wait_for(self.process.wait(), timeout=5)
+            except asyncio.TimeoutError:
+                self.process.kill()
+                await self.process.wait()
+        elif self._stdin:
+            self._stdin.close()
+        for task in (self._reader, self._stderr_drain):
+            if task:
+                task.cancel()
+                await asyncio.wait([task], timeout=1)
     
-    def _send_request(self, method: str, params: dict) -> dict:
-        """Send a JSON-RPC request and wait for response"""
-        if not self.process or not self.process.stdin or not self.process.stdout:
-            raise RuntimeError(f"Server {self.name} not started")
-        
-        msg_id = next_id()
+    async def _send_request(self, method: str, params: dict, timeout: Optional[float] = None) -> dict:
+        """Send a JSON-RPC request and wait for response (``timeout`` overrides self.timeout)"""
+        msg_id = _next_id()
         request = {
             "jsonrpc": "2.0",
             "id": msg_id,
             "method": method,
             "params": params
         }
+        return await self._send_frame(msg_id, _dumps(request) + b"\n", method, timeout)
+    
+    async def _send_frame(
+        self, msg_id: int, frame: bytes, method: str, timeout: Optional[float] = None
+    ) -> dict:
+        """Write an encoded request with id ``msg_id`` and wait for its response"""
+        if not self._stdin or not self._stdout:
+            raise RuntimeError(f"Server {self.name} not started")
+        if timeout is None:
+            timeout = self.timeout
         
-        # Send request
-        request_line = json.dumps(request) + "\n"
-        self.process.stdin.write(request_line)
-        self.process.stdin.flush()
-        
-        # Read response (may need to skip notifications)
-        while True:
-            response_line = self.process.stdout.readline()
-            if not response_line:
-                stderr = self.process.stderr.read() if self.process.stderr else ""
-                raise RuntimeError(f"Server {self.name} closed unexpectedly: {stderr}")
+        async with self.limiter or contextlib.nullcontext():
+            if self._closed:
+                raise self._closed
             
+            # Register before writing so the reader task can never miss the response
+            future = asyncio.get_running_loop().create_future()
+            self._pending[msg_id] = future
             try:
-                response = json.loads(response_line)
-                # Skip notifications (no id field)
-                if "id" in response:
-                    return response
-            except json.JSONDecodeError as e:
-                print(f"[{self.name}] Invalid JSON: {response_line[:100]}...", file=sys.stderr)
-                continue
+                # Send request
+                self._stdin.write(frame)
+                await self._stdin.drain()
+                
+                return await asyncio.wait_for(future, timeout=timeout)
+            except asyncio.TimeoutError:
+                raise TimeoutError(f"{self.name} did not respond to {method} within {timeout}s") from None
+            finally:
+                self._pending.pop(msg_id, None)
     
-    def _send_notification(self, method: str, params: dict) -> None:
-        """Send a JSON-RPC notification (no response expected)"""
-        if not self.process or not self.process.stdin:
-            raise RuntimeError(f"Server {self.name} not started")
+    async def _read_responses(self) -> None:
+        """Dispatch responses to their pending requests by id.
         
-        notification = {
-            "jsonrpc": "2.0",
-            "method": method,
-            "params": params
-        }
-        notification_line = json.dumps(notification) + "\n"
-        self.process.stdin.write(notification_line)
-        self.process.stdin.flush()
+        MCP stdio frames messages by newline only (no Content-Length headers),
+        so stdout is read in large chunks and split on newlines in place; one
+        await can then deliver many pipelined responses.
+        """
+        buffer = bytearray()
+        try:
+            while True:
+                chunk = await self._stdout.read(READ_CHUNK)
+                if not chunk:
+                    stderr = await self._stderr_text()
+                    self._closed = RuntimeError(f"Server {self.name} closed unexpectedly: {stderr}")
+                    return
+                
+                # Only the new chunk can contain the end of a partial line, so a
+                # long response is scanned once rather than once per chunk
+                scan = len(buffer)
+                buffer += chunk
+                start = 0
+                with memoryview(buffer) as view:
+                    while (end := buffer.find(b"\n", max(start, scan))) != -1:
+                        self._dispatch(view[start:end])
+                        start = end + 1
+                del buffer[:start]
+        except Exception as e:
+            # e.g. a reset daemon connection
+            self._closed = RuntimeError(f"Lost connection to {self.name}: {e!r}")
+        finally:
+            # However the reader ends (EOF, error, stop()), nothing can answer the
+            # outstanding requests any more, so fail them now instead of at their timeout
+            if self._closed is None:
+                self._closed = RuntimeError(f"Server {self.name} was stopped")
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(self._closed)
     
-    def list_tools(self) -> list[dict]:
-        """Get list of available tools"""
-        response = self._send_request("tools/list", {})
-        if "error" in response:
-            raise RuntimeError(f"Error listing tools: {response['error']}")
-        return response.get("result", {}).get("tools", [])
+    def _dispatch(self, line: memoryview) -> None:
+        """Resolve the pending request a single response line answers"""
+        try:
+            response = _loads(line)
+        except ValueError:  # JSONDecodeError, or undecodable bytes with stdlib json
+            if line.nbytes and not bytes(line).isspace():
+                print(f"[{self.name}] Invalid JSON: {bytes(line[:100])}...", file=sys.stderr)
+            return
+        
+        # Skip notifications (no id field) and server-initiated requests, and
+        # ids that cannot be ours (we only issue ints)
+        if not isinstance(response, dict) or "method" in response or not isinstance(response.get("id"), int):
+            return
+        future = self._pending.get(response["id"])
+        if future and not future.done():
+            future.set_result(response)
+    
+    async def list_tools(self) -> list[dict]:
+        """Get list of available tools (cached until the server is stopped)"""
+        if self._tools is None:
+            msg_id = _next_id()
+            response = await self._send_frame(msg_id, _TOOLS_LIST_TEMPLATE % msg_id, "tools/list")
+            if "error" in response:
+                raise RuntimeError(f"Error listing tools: {response['error']}")
+            self._tools = response.get("result", {}).get("tools", [])
+        return self._tools
     
-    def call_tool(self, name: str, arguments: dict) -> dict:
+    async def call_tool(self, name: str, arguments: dict) -> dict:
         """Call a tool and return the result"""
-        response = self._send_request("tools/call", {
+        response = await self._send_request("tools/call", {
             "name": name,
             "arguments": arguments
         })
-        if "error" in response:
-            return {"error": response["error"]}
+        return self._tool_result(response)
+    
+    async def call_tool_cached(self, name: str, arguments: dict, ttl: float = DISCOVERY_TTL) -> dict:
+        """Call a read-only discovery tool, reusing a result younger than ``ttl`` seconds"""
+        key = (name, frozenset(arguments.items()))
+        cached = self._discovery.get(key)
+        if cached and time.monotonic() - cached[0] < ttl:
+            return cached[1]
         
-        result = response.get("result", {})
+        result = await self.call_tool(name, arguments)
+        if "error" not in result:
+            self._discovery[key] = (time.monotonic(), result)
+        return result
+    
+    async def call_tools_batch(self, calls: list[tuple[str, dict]]) -> list[CallOutcome]:
+        """Call several tools concurrently, returning result shapes in call order.
+        
+        MCP stdio transports accept a single JSON-RPC message per line (no array
+        batches), so requests are pipelined on the same pipe and responses are
+        matched by id. At most ``max_concurrent`` requests are in flight on this
+        server at a time (and no more than ``limiter`` allows across servers) to
+        avoid flooding the Bitbucket API. Each result is reduced to its shape as
+        soon as it arrives, so full payloads are dropped immediately. With a
+        ``cache``, fresh cached responses are used without contacting the server.
+        A call that fails (e.g. times out) yields its exception in place of a
+        shape, so one slow tool does not discard the other results.
+        """
+        async def call(name: str, arguments: dict) -> TestShape:
+            if self.cache and (cached := self.cache.get(self.name, name, arguments)):
+                return self._tool_shape(cached)
+            async with self._slots:
+                response = await self._send_request("tools/call", {
+                    "name": name,
+                    "arguments": arguments
+                })
+            shape = self._tool_shape(response)
+            # Errors may be transient, so only successful results are cached. Tool
+            # failures (exceptions, invalid arguments) arrive as isError results
+            # whose plain text does not parse into an "error" key.
+            result = response.get("result", {})
+            if self.cache and not shape.has_error and "error" not in response and not result.get("isError"):
+                self.cache.put(self.name, name, arguments, {"result": result})
+            return shape
+        
+        async def outcome(name: str, arguments: dict) -> CallOutcome:
+            try:
+                return await call(name, arguments)
+            except Exception as e:
+                return e
+        
+        return list(await asyncio.gather(*(outcome(name, arguments) for name, arguments in calls)))
+    
+    @staticmethod
+    def _tool_text(response: dict) -> Optional[str]:
+        """Text content of a successful tools/call response, if any"""
+        if "error" in response:
+            return None
         # Extract text content from MCP response format
-        contents = result.get("content", [])
+        contents = response.get("result", {}).get("content", [])
         if contents and len(contents) > 0:
-            text = contents[0].get("text", "{}")
+            return contents[0].get("text", "{}")
+        return None
+    
+    def _tool_result(self, response: dict) -> dict:
+        """Extract the tool result from a tools/call response"""
+        text = self._tool_text(response)
+        if text is not None:
+            return _parse_text(text)
+        if "error" in response:
+            return {"error": response["error"]}
+        return response.get("result", {})
+    
+    def _tool_shape(self, response: dict) -> TestShape:
+        """Extract the shape of the tool result, reusing shapes of identical payloads"""
+        text = self._tool_text(response)
+        if text is not None:
+            return _text_shape(text)
+        return TestShape.from_result(self._tool_result(response))
+
+
+@dataclass
+class DaemonMCPServer(MCPServer):
+    """MCPServer reached through the evaluation daemon instead of a child process.
+    
+    The daemon keeps one warm subprocess per (name, command, env, cwd) and relays
+    JSON-RPC lines over a Unix socket, so repeated runs skip interpreter boot,
+    the MCP handshake and Bitbucket authentication. ``fingerprint`` identifies
+    the server's build; when it changes the daemon restarts the server.
+    """
+    fingerprint: str = ""
+    socket_path: Optional[Path] = None
+    
+    async def start(self) -> None:
+        """Connect to the daemon and attach to its server"""
+        socket_path = self.socket_path or daemon_socket()
+        # The hello line carries the credentials; only hand them to our own daemon
+        _check_private(socket_path, stat.S_ISSOCK)
+        reader, writer = await asyncio.open_unix_connection(str(socket_path), limit=READ_LIMIT)
+        writer.write(_dumps({
+            "name": self.name,
+            "command": self.command,
+            "env": self.env,
+            "cwd": self.cwd,
+            "fingerprint": self.fingerprint,
+            "timeout": self.timeout,
+        }) + b"\n")
+        await self._connect(reader, writer)
+
+
+async def ensure_daemon(socket_path: Optional[Path] = None, timeout: float = 10) -> None:
+    """Spawn the connection-cache daemon unless one is already listening"""
+    socket_path = socket_path or daemon_socket()
+    try:
+        _, writer = await asyncio.open_unix_connection(str(socket_path))
+        writer.close()
+        return
+    except (FileNotFoundError, ConnectionRefusedError):
+        pass
+    
+    subprocess.Popen(
+        [sys.executable, str(Path(__file__).resolve()), "--serve-daemon"],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        await asyncio.sleep(0.1)
+        try:
+            _, writer = await asyncio.open_unix_connection(str(socket_path))
+            writer.close()
+            return
+        except (FileNotFoundError, ConnectionRefusedError):
+            continue
+    raise RuntimeError(f"Evaluation daemon did not start listening on {socket_path}")
+
+
+async def serve_daemon(
+    socket_path: Optional[Path] = None,
+    idle_timeout: float = DAEMON_IDLE_TIMEOUT,
+) -> None:
+    """Serve warm MCP servers to evaluation runs until idle for ``idle_timeout`` seconds"""
+    socket_path = socket_path or daemon_socket()
+    # Keyed by the server's identity; each entry remembers the build it was started from
+    servers: dict[bytes, tuple[str, MCPServer]] = {}
+    lock = asyncio.Lock()
+    clients = 0
+    last_activity = time.monotonic()
+    
+    async def attach(spec: dict, timeout: float) -> MCPServer:
+        fingerprint = spec.pop("fingerprint", "")
+        key = _dumps(spec)
+        async with lock:
+            if key in servers:
+                started_from, server = servers[key]
+                if started_from == fingerprint and not server._closed and server.process.returncode is None:
+                    return server
+                # Rebuilt (or dead) server: replace it rather than serve stale code
+                del servers[key]
+                await server.stop()
+            server = MCPServer(spec["name"], spec["command"], spec["env"], cwd=spec["cwd"], timeout=timeout)
             try:
-                return json.loads(text)
-            except json.JSONDecodeError:
-                return {"raw": text}
-        return result
+                await server.start()
+            except Exception:
+                await server.stop()
+                raise
+            servers[key] = (fingerprint, server)
+            return server
+    
+    async def relay(
+        server: Optional[MCPServer],
+        request: dict,
+        writer: asyncio.StreamWriter,
+        timeout: float,
+    ) -> None:
+        try:
+            if server is None:
+                raise RuntimeError("Server could not be started by the evaluation daemon")
+            # The daemon completed the handshake once; replay its result to each client
+            if request.get("method") == "initialize":
+                response = {"jsonrpc": "2.0", "result": server.initialize_result}
+            else:
+                # Servers are shared, so each request gets its own client's timeout
+                response = dict(await server._send_request(
+                    request["method"], request.get("params", {}), timeout
+                ))
+        except Exception as e:
+            response = {"jsonrpc": "2.0", "error": {"code": -32603, "message": str(e)}}
+        # Client ids are only unique per client, so map back from the daemon's ids
+        response["id"] = request["id"]
+        writer.write(_dumps(response) + b"\n")
+        await writer.drain()
+    
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        nonlocal clients, last_activity
+        clients += 1
+        relays: set[asyncio.Task] = set()
+        try:
+            hello = (await reader.readline()).strip()
+            if not hello:
+                return  # liveness probe from ensure_daemon
+            spec = _loads(hello)
+            timeout = spec.pop("timeout", REQUEST_TIMEOUT)
+            try:
+                server = await attach(spec, timeout)
+            except Exception as e:
+                # Keep reading so the client's requests fail instead of hanging
+                print(f"[daemon] Could not start server: {e}", file=sys.stderr)
+                server = None
+            while request_line := await reader.readline():
+                request = _loads(request_line)
+                # Notifications (initialized) were already sent by the daemon
+                if "id" in request:
+                    task = asyncio.create_task(relay(server, request, writer, timeout))
+                    relays.add(task)
+                    task.add_done_callback(relays.discard)
+            await asyncio.gather(*relays, return_exceptions=True)
+        except Exception as e:
+            print(f"[daemon] Client error: {e}", file=sys.stderr)
+        finally:
+            clients -= 1
+            last_activity = time.monotonic()
+            writer.close()
+    
+    # Requests carry the Bitbucket credentials, so the socket is created owner-only
+    umask = os.umask(0o177)
+    try:
+        unix_server = await asyncio.start_unix_server(handle, path=str(socket_path), limit=READ_LIMIT)
+    finally:
+        os.umask(umask)
+    try:
+        while clients or time.monotonic() - last_activity < idle_timeout:
+            await asyncio.sleep(min(idle_timeout, 5))
+    finally:
+        unix_server.close()
+        socket_path.unlink(missing_ok=True)
+        for _, server in servers.values():
+            await server.stop()
 
 
 @dataclass
@@ -154,50 +760,60 @@ class TestResult:
     """Result of a single tool test"""
     tool_name: str
     success: bool
-    python_result: Optional[dict] = None
-    typescript_result: Optional[dict] = None
+    python_result: Optional[TestShape] = None
+    typescript_result: Optional[TestShape] = None
     error: Optional[str] = None
-    differences: list[str] = field(default_factory=list)
+    differences: Sequence[str] = ()
+
 
+# Top-level keys whose values are expected to differ between the servers
+_IGNORE = frozenset({"updated", "created", "created_on", "updated_on", "date", "timestamp"})
 
-def compare_results(py_result: dict, ts_result: dict, ignore_keys: set[str] = None) -> list[str]:
-    """Compare two result dictionaries and return list of differences"""
-    if ignore_keys is None:
-        ignore_keys = {"updated", "created", "created_on", "updated_on", "date", "timestamp"}
+
+def compare_results(
+    py_result: TestShape,
+    ts_result: TestShape,
+    ignore_keys: Optional[AbstractSet[str]] = None,
+) -> list[str]:
+    """Compare two result shapes and return list of differences"""
+    ignore = _IGNORE if ignore_keys is None else ignore_keys
+    
+    # Identical shapes cannot differ in anything compared below
+    if py_result == ts_result:
+        return []
     
     differences = []
     
     # Check for errors
-    if "error" in py_result and "error" not in ts_result:
-        differences.append(f"Python returned error, TypeScript did not")
-    elif "error" not in py_result and "error" in ts_result:
-        differences.append(f"TypeScript returned error, Python did not")
-    elif "error" in py_result and "error" in ts_result:
-        return []  # Both errored, consider this a match
+    match py_result.has_error, ts_result.has_error:
+        case True, True:
+            return []  # Both errored, consider this a match
+        case True, False:
+            differences.append("Python returned error, TypeScript did not")
+        case False, True:
+            differences.append("TypeScript returned error, Python did not")
     
     # Compare top-level keys
-    py_keys = set(py_result.keys()) - ignore_keys
-    ts_keys = set(ts_result.keys()) - ignore_keys
-    
-    if py_keys != ts_keys:
-        missing_in_ts = py_keys - ts_keys
-        missing_in_py = ts_keys - py_keys
-        if missing_in_ts:
-            differences.append(f"Keys missing in TypeScript: {missing_in_ts}")
-        if missing_in_py:
-            differences.append(f"Keys missing in Python: {missing_in_py}")
-    
-    # Compare common keys
+    py_keys = py_result.keys - ignore
+    ts_keys = ts_result.keys - ignore
+    
+    if missing_in_ts := py_keys - ts_keys:
+        differences.append(f"Keys missing in TypeScript: {set(missing_in_ts)}")
+    if missing_in_py := ts_keys - py_keys:
+        differences.append(f"Keys missing in Python: {set(missing_in_py)}")
+    
+    # Compare common keys. Fields are (type name, list length) tuples, so one
+    # tuple comparison covers both the type and, for arrays, the length.
+    py_fields, ts_fields = py_result.fields, ts_result.fields
     for key in py_keys & ts_keys:
-        py_val = py_result[key]
-        ts_val = ts_result[key]
-        
-        # For arrays, compare length and structure
-        if isinstance(py_val, list) and isinstance(ts_val, list):
-            if len(py_val) != len(ts_val):
-                differences.append(f"Array '{key}' length differs: Python={len(py_val)}, TypeScript={len(ts_val)}")
-        elif type(py_val) != type(ts_val):
-            differences.append(f"Type mismatch for '{key}': Python={type(py_val).__name__}, TypeScript={type(ts_val).__name__}")
+        py_field, ts_field = py_fields[key], ts_fields[key]
+        if py_field == ts_field:
+            continue
+        (py_type, py_len), (ts_type, ts_len) = py_field, ts_field
+        if py_type == ts_type == "list":
+            differences.append(f"Array '{key}' length differs: Python={py_len}, TypeScript={ts_len}")
+        else:
+            differences.append(f"Type mismatch for '{key}': Python={py_type}, TypeScript={ts_type}")
     
     return differences
 
@@ -220,38 +836,161 @@ SAFE_TOOLS_WITH_REPO = [
 ]
 
 
-def run_evaluation(
+def repo_calls(test_repo: str) -> list[tuple[str, dict]]:
+    """SAFE_TOOLS_WITH_REPO invocations bound to a repository"""
+    return [
+        (tool_name, {"repo_slug": test_repo, **base_args})
+        for tool_name, base_args in SAFE_TOOLS_WITH_REPO
+    ]
+
+
+async def _none() -> None:
+    """Placeholder awaitable for a server that is not running"""
+    return None
+
+
+def _dispatch_batch(
+    ts_server: MCPServer,
+    py_server: Optional[MCPServer],
+    calls: list[tuple[str, dict]],
+) -> asyncio.Future:
+    """Send a batch to both servers at once; resolves to (ts_results, py_results or None)"""
+    async def run() -> tuple[list[CallOutcome], Optional[list[CallOutcome]]]:
+        return await asyncio.gather(
+            ts_server.call_tools_batch(calls),
+            py_server.call_tools_batch(calls) if py_server else _none(),
+        )
+    
+    return asyncio.ensure_future(run())
+
+
+def _print_test(tool_name: str, args: dict) -> None:
+    if "repo_slug" in args:
+        print(f"\nTesting: {tool_name} (repo={args['repo_slug']})")
+    else:
+        print(f"\nTesting: {tool_name}")
+
+
+def _print_outcome(server_name: str, shape: TestShape) -> None:
+    if shape.has_error:
+        print(f"  {server_name}: ⚠ {shape.error}")
+    else:
+        print(f"  {server_name}: ✓")
+
+
+def _failed_test(tool_name: str, error: Exception) -> TestResult:
+    print(f"  ✗ Error: {error}")
+    return TestResult(tool_name=tool_name, success=False, error=str(error))
+
+
+def _report_ts_only(calls: list[tuple[str, dict]], ts_results: list[CallOutcome]) -> list[TestResult]:
+    """Report TypeScript results alone; there is nothing to compare against"""
+    results = []
+    for (tool_name, args), ts_result in zip(calls, ts_results):
+        _print_test(tool_name, args)
+        if isinstance(ts_result, Exception):
+            results.append(_failed_test(tool_name, ts_result))
+            continue
+        _print_outcome("TypeScript", ts_result)
+        results.append(TestResult(tool_name=tool_name, success=True, typescript_result=ts_result))
+    return results
+
+
+def _report_compare(
+    calls: list[tuple[str, dict]],
+    ts_results: list[CallOutcome],
+    py_results: list[CallOutcome],
+) -> list[TestResult]:
+    """Report and compare the results of both servers"""
+    results = []
+    for (tool_name, args), ts_result, py_result in zip(calls, ts_results, py_results):
+        _print_test(tool_name, args)
+        if isinstance(ts_result, Exception):
+            results.append(_failed_test(tool_name, ts_result))
+            continue
+        _print_outcome("TypeScript", ts_result)
+        if isinstance(py_result, Exception):
+            results.append(_failed_test(tool_name, py_result))
+            continue
+        _print_outcome("Python", py_result)
+        
+        # Compare results
+        differences = compare_results(py_result, ts_result)
+        if differences:
+            print(f"  Differences: {differences}")
+        else:
+            print(f"  ✓ Results match")
+        
+        results.append(TestResult(
+            tool_name=tool_name,
+            success=not differences,
+            python_result=py_result,
+            typescript_result=ts_result,
+            differences=differences,
+        ))
+    return results
+
+
+async def run_evaluation(
     python_cmd: list[str],
     typescript_cmd: list[str],
     env: dict[str, str],
     test_repo: Optional[str] = None,
     ts_only: bool = False,
+    *,
+    python_cwd: Optional[str] = None,
+    daemon: bool = False,
+    max_parallel: int = GLOBAL_MAX_PARALLEL,
+    timeout: float = REQUEST_TIMEOUT,
+    cache: Optional[ResultCache] = None,
+    fingerprints: Optional[dict[str, str]] = None,
 ) -> list[TestResult]:
     """Run the evaluation comparing Python and TypeScript MCP servers"""
     
     results: list[TestResult] = []
     
     # Start servers
-    ts_server = MCPServer("TypeScript", typescript_cmd, env)
-    py_server = MCPServer("Python", python_cmd, env) if not ts_only else None
+    limiter = asyncio.Semaphore(max_parallel)
+    
+    def make_server(name: str, command: list[str], cwd: Optional[str] = None) -> MCPServer:
+        kwargs = dict(cwd=cwd, timeout=timeout, limiter=limiter, cache=cache)
+        if daemon:
+            # Lets the daemon notice a rebuilt server and restart it
+            return DaemonMCPServer(name, command, env, fingerprint=(fingerprints or {}).get(name, ""), **kwargs)
+        return MCPServer(name, command, env, **kwargs)
+    
+    ts_server = make_server("TypeScript", typescript_cmd)
+    py_server = make_server("Python", python_cmd, cwd=python_cwd) if not ts_only else None
     
     try:
         print("Starting MCP servers...")
-        ts_server.start()
-        print(f"  ✓ TypeScript server started")
+        # Both servers are independent, so start them (and query them) concurrently
+        servers = [server for server in (ts_server, py_server) if server]
+        if daemon:
+            await ensure_daemon()
+        await asyncio.gather(*(server.start() for server in servers))
+        for server in servers:
+            print(f"  ✓ {server.name} server started")
         
-        if py_server:
-            py_server.start()
-            print(f"  ✓ Python server started")
+        # Scatter: everything that does not depend on the test repo goes out now,
+        # so repository discovery overlaps with the tool listing and SAFE_TOOLS
+        listing = asyncio.gather(
+            ts_server.list_tools(),
+            py_server.list_tools() if py_server else _none(),
+        )
+        batches = [_dispatch_batch(ts_server, py_server, SAFE_TOOLS)]
+        discovery = (
+            asyncio.ensure_future(ts_server.call_tool_cached("list_repositories", {"limit": 1}))
+            if not test_repo else None
+        )
         
         # List and compare tools
         print("\n--- Tool Listing ---")
-        ts_tools = ts_server.list_tools()
+        ts_tools, py_tools = await listing
         ts_tool_names = {t["name"] for t in ts_tools}
         print(f"TypeScript: {len(ts_tools)} tools")
         
         if py_server:
-            py_tools = py_server.list_tools()
             py_tool_names = {t["name"] for t in py_tools}
             print(f"Python: {len(py_tools)} tools")
             
@@ -266,9 +1005,9 @@ def run_evaluation(
                 print(f"  ✓ Tool sets match!")
         
         # Get a test repo if not provided
-        if not test_repo:
+        if discovery:
             print("\n--- Finding test repository ---")
-            ts_repos = ts_server.call_tool("list_repositories", {"limit": 1})
+            ts_repos = await discovery
             repos = ts_repos.get("repositories", [])
             if repos:
                 test_repo = repos[0].get("name")
@@ -276,93 +1015,39 @@ def run_evaluation(
             else:
                 print("  ⚠ No repositories found, skipping repo-specific tests")
         
-        # Test safe tools
+        calls = list(SAFE_TOOLS)
+        if test_repo:
+            bound_calls = repo_calls(test_repo)
+            calls += bound_calls
+            batches.append(_dispatch_batch(ts_server, py_server, bound_calls))
+        
+        # Gather: harvest every batch before reporting
         print("\n--- Testing Read-Only Tools ---")
         
-        for tool_name, args in SAFE_TOOLS:
-            print(f"\nTesting: {tool_name}")
-            result = TestResult(tool_name=tool_name, success=True)
-            
-            try:
-                ts_result = ts_server.call_tool(tool_name, args)
-                result.typescript_result = ts_result
-                
-                if "error" in ts_result:
-                    print(f"  TypeScript: ⚠ {ts_result['error']}")
-                else:
-                    print(f"  TypeScript: ✓")
-                
-                if py_server:
-                    py_result = py_server.call_tool(tool_name, args)
-                    result.python_result = py_result
-                    
-                    if "error" in py_result:
-                        print(f"  Python: ⚠ {py_result['error']}")
-                    else:
-                        print(f"  Python: ✓")
-                    
-                    # Compare results
-                    differences = compare_results(py_result, ts_result)
-                    result.differences = differences
-                    if differences:
-                        print(f"  Differences: {differences}")
-                        result.success = False
-                    else:
-                        print(f"  ✓ Results match")
-                
-            except Exception as e:
-                result.success = False
-                result.error = str(e)
-                print(f"  ✗ Error: {e}")
-            
-            results.append(result)
+        try:
+            harvested = await asyncio.gather(*batches)
+        except Exception as e:
+            print(f"  ✗ Error: {e}")
+            for tool_name, _ in calls:
+                results.append(TestResult(tool_name=tool_name, success=False, error=str(e)))
+            return results
         
-        # Test repo-specific tools
-        if test_repo:
-            for tool_name, base_args in SAFE_TOOLS_WITH_REPO:
-                args = {"repo_slug": test_repo, **base_args}
-                print(f"\nTesting: {tool_name} (repo={test_repo})")
-                result = TestResult(tool_name=tool_name, success=True)
-                
-                try:
-                    ts_result = ts_server.call_tool(tool_name, args)
-                    result.typescript_result = ts_result
-                    
-                    if "error" in ts_result:
-                        print(f"  TypeScript: ⚠ {ts_result.get('error', ts_result)}")
-                    else:
-                        print(f"  TypeScript: ✓")
-                    
-                    if py_server:
-                        py_result = py_server.call_tool(tool_name, args)
-                        result.python_result = py_result
-                        
-                        if "error" in py_result:
-                            print(f"  Python: ⚠ {py_result.get('error', py_result)}")
-                        else:
-                            print(f"  Python: ✓")
-                        
-                        differences = compare_results(py_result, ts_result)
-                        result.differences = differences
-                        if differences:
-                            print(f"  Differences: {differences}")
-                            result.success = False
-                        else:
-                            print(f"  ✓ Results match")
-                    
-                except Exception as e:
-                    result.success = False
-                    result.error = str(e)
-                    print(f"  ✗ Error: {e}")
-                
-                results.append(result)
+        if cache and cache.hits:
+            print(f"  {cache.hits} results served from {cache.directory}")
+        
+        ts_results = [r for batch_ts, _ in harvested for r in batch_ts]
+        if py_server:
+            py_results = [r for _, batch_py in harvested for r in batch_py]
+            results += _report_compare(calls, ts_results, py_results)
+        else:
+            results += _report_ts_only(calls, ts_results)
         
     finally:
         print("\n--- Stopping servers ---")
-        ts_server.stop()
+        await ts_server.stop()
         print(f"  ✓ TypeScript server stopped")
         if py_server:
-            py_server.stop()
+            await py_server.stop()
             print(f"  ✓ Python server stopped")
     
     return results
@@ -399,7 +1084,41 @@ def main():
     parser = argparse.ArgumentParser(description="Evaluate Bitbucket MCP servers")
     parser.add_argument("--ts-only", action="store_true", help="Only test TypeScript version")
     parser.add_argument("--repo", help="Repository slug to test with")
+    parser.add_argument(
+        "--daemon",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help=f"Reuse warm servers from a background daemon (idle timeout {DAEMON_IDLE_TIMEOUT}s)",
+    )
+    parser.add_argument(
+        "--max-parallel",
+        type=int,
+        default=GLOBAL_MAX_PARALLEL,
+        help="Maximum requests in flight across both servers",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=REQUEST_TIMEOUT,
+        help="Seconds to wait for each server response",
+    )
+    parser.add_argument("--cache-dir", type=Path, help="Cache tool results on disk in this directory")
+    parser.add_argument(
+        "--max-age",
+        type=float,
+        default=CACHE_MAX_AGE,
+        help="Seconds a cached result stays valid (with --cache-dir)",
+    )
+    parser.add_argument("--serve-daemon", action="store_true", help=argparse.SUPPRESS)
     args = parser.parse_args()
+    if args.max_parallel < 1:
+        parser.error("--max-parallel must be at least 1")
+    if args.daemon and not hasattr(os, "getuid"):
+        parser.error("--daemon needs Unix sockets and is only supported on POSIX systems")
+    
+    if args.serve_daemon:
+        asyncio.run(serve_daemon())
+        return
     
     # Check required environment variables
     required_vars = ["BITBUCKET_WORKSPACE", "BITBUCKET_EMAIL", "BITBUCKET_API_TOKEN"]
@@ -417,7 +1136,11 @@ def main():
         "BITBUCKET_WORKSPACE": os.environ["BITBUCKET_WORKSPACE"],
         "BITBUCKET_EMAIL": os.environ["BITBUCKET_EMAIL"],
         "BITBUCKET_API_TOKEN": os.environ["BITBUCKET_API_TOKEN"],
+        # Results are compared as JSON, so a toon OUTPUT_FORMAT is overridden
+        "OUTPUT_FORMAT": "json",
     }
+    # Both servers' own settings (see their settings modules) pass through
+    env.update({k: os.environ[k] for k in ("API_TIMEOUT", "MAX_RETRIES") if k in os.environ})
     
     # Determine paths
     script_dir = Path(__file__).parent.parent
@@ -428,6 +1151,21 @@ def main():
         print("Run: cd typescript && npm run build")
         sys.exit(1)
     
+    # Identify each server's build, for the result cache and the daemon
+    fingerprints = {
+        "TypeScript": source_fingerprint(ts_dist),
+        "Python": source_fingerprint(script_dir / "python" / "src"),
+    }
+    
+    cache = None
+    if args.cache_dir:
+        cache = ResultCache(
+            args.cache_dir,
+            max_age=args.max_age,
+            namespace=f"{env['BITBUCKET_WORKSPACE']}|{CACHE_VERSION}",
+            fingerprints=fingerprints,
+        )
+    
     # Commands to start servers
     typescript_cmd = ["node", str(ts_dist)]
     python_cmd = ["uv", "run", "python", "-m", "src.server"]
@@ -440,23 +1178,23 @@ def main():
     if not args.ts_only:
         print(f"Python: {script_dir / 'python'}")
     
-    # Change to python directory for Python server
-    original_cwd = os.getcwd()
-    os.chdir(script_dir / "python")
+    results = asyncio.run(run_evaluation(
+        python_cmd=python_cmd,
+        typescript_cmd=typescript_cmd,
+        env=env,
+        # The Python server runs from the python directory
+        python_cwd=str(script_dir / "python"),
+        test_repo=args.repo,
+        ts_only=args.ts_only,
+        daemon=args.daemon,
+        max_parallel=args.max_parallel,
+        timeout=args.timeout,
+        cache=cache,
+        fingerprints=fingerprints,
+    ))
     
-    try:
-        results = run_evaluation(
-            python_cmd=python_cmd,
-            typescript_cmd=typescript_cmd,
-            env=env,
-            test_repo=args.repo,
-            ts_only=args.ts_only,
-        )
-        
-        success = print_summary(results)
-        sys.exit(0 if success else 1)
-    finally:
-        os.chdir(original_cwd)
+    success = print_summary(results)
+    sys.exit(0 if success else 1)
 
 
 if __name__ == "__main__":
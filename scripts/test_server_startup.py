@@ -4,11 +4,40 @@ Quick test to verify MCP server can start and list tools.
 This doesn't require any credentials - it just tests that the server binary works.
 """
 
-import json
+import collections
+import io
 import subprocess
 import sys
+import threading
 from pathlib import Path
 
+# orjson if installed, stdlib json otherwise; both accept bytes
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
+# Requests are fixed, so they are encoded once up front
+_INIT_FRAME = (
+    b'{"jsonrpc":"2.0","id":1,"method":"initialize","params":{'
+    b'"protocolVersion":"2024-11-05","capabilities":{},'
+    b'"clientInfo":{"name":"test","version":"1.0.0"}}}\n'
+)
+_INITIALIZED_FRAME = b'{"jsonrpc":"2.0","method":"notifications/initialized","params":{}}\n'
+_TOOLS_LIST_FRAME = b'{"jsonrpc":"2.0","id":2,"method":"tools/list","params":{}}\n'
+
+# Pipe buffer sizes; responses such as tools/list are large JSON lines
+WRITE_BUFFER_SIZE = 64 * 1024
+READ_BUFFER_SIZE = 1024 * 1024
+
+# Lines of server stderr kept for the failure report
+STDERR_TAIL_LINES = 500
+
+def _drain_stderr(stream: io.BufferedReader, tail: collections.deque) -> None:
+    """Consume stderr until EOF so the server never blocks writing to it"""
+    for line in iter(stream.readline, b""):
+        tail.append(line)
+
 def test_server_startup(name: str, command: list[str], expect_config_error: bool = False) -> bool:
     """Test that a server can start and respond to initialize"""
     print(f"\nTesting {name} server startup...")
@@ -19,29 +48,29 @@ def test_server_startup(name: str, command: list[str], expect_config_error: bool
             stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            text=True,
+            bufsize=0,
+        )
+        # Unbuffered binary pipes wrapped in large buffers: one syscall per message
+        # instead of line-buffered text I/O
+        stdin = io.BufferedWriter(process.stdin, buffer_size=WRITE_BUFFER_SIZE)
+        stdout = io.BufferedReader(process.stdout, buffer_size=READ_BUFFER_SIZE)
+        stderr_tail = collections.deque(maxlen=STDERR_TAIL_LINES)
+        stderr_drain = threading.Thread(
+            target=_drain_stderr,
+            args=(io.BufferedReader(process.stderr), stderr_tail),
+            daemon=True,
         )
+        stderr_drain.start()
         
         # Send initialize request
-        init_request = json.dumps({
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": "initialize",
-            "params": {
-                "protocolVersion": "2024-11-05",
-                "capabilities": {},
-                "clientInfo": {"name": "test", "version": "1.0.0"}
-            }
-        }) + "\n"
-        
-        process.stdin.write(init_request)
-        process.stdin.flush()
+        stdin.write(_INIT_FRAME)
+        stdin.flush()
         
         # Read response with timeout
         import select
-        if select.select([process.stdout], [], [], 5)[0]:
-            response_line = process.stdout.readline()
-            response = json.loads(response_line)
+        # An empty line means the server exited; report it like a timeout
+        if select.select([stdout], [], [], 5)[0] and (response_line := stdout.readline()):
+            response = _loads(response_line)
             
             if "error" in response:
                 if expect_config_error:
@@ -60,23 +89,12 @@ def test_server_startup(name: str, command: list[str], expect_config_error: bool
                 print(f"    Version: {result.get('serverInfo', {}).get('version', 'unknown')}")
                 
                 # Send tools/list
-                process.stdin.write(json.dumps({
-                    "jsonrpc": "2.0",
-                    "method": "notifications/initialized",
-                    "params": {}
-                }) + "\n")
-                process.stdin.flush()
-                
-                process.stdin.write(json.dumps({
-                    "jsonrpc": "2.0",
-                    "id": 2,
-                    "method": "tools/list",
-                    "params": {}
-                }) + "\n")
-                process.stdin.flush()
+                stdin.write(_INITIALIZED_FRAME)
+                stdin.write(_TOOLS_LIST_FRAME)
+                stdin.flush()
                 
-                if select.select([process.stdout], [], [], 5)[0]:
-                    tools_response = json.loads(process.stdout.readline())
+                if select.select([stdout], [], [], 5)[0]:
+                    tools_response = _loads(stdout.readline())
                     if "result" in tools_response:
                         tools = tools_response["result"].get("tools", [])
                         print(f"  ✓ Listed {len(tools)} tools")
@@ -86,7 +104,8 @@ def test_server_startup(name: str, command: list[str], expect_config_error: bool
                 process.terminate()
                 return True
         else:
-            stderr = process.stderr.read()
+            stderr_drain.join(timeout=1)
+            stderr = b"".join(stderr_tail).decode(errors="replace")
             if expect_config_error and "Configuration error" in stderr:
                 print(f"  ✓ Server exited with expected config error")
                 return True
@@ -102,6 +121,7 @@ def test_server_startup(name: str, command: list[str], expect_config_error: bool
         try:
             process.terminate()
             process.wait(timeout=2)
+            stderr_drain.join(timeout=1)
         except:
             pass
 
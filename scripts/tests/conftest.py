@@ -0,0 +1,7 @@
+"""Pytest configuration for the evaluation script tests."""
+
+import sys
+from pathlib import Path
+
+# The scripts are standalone files, not a package; make them importable
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
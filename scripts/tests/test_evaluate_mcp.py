@@ -0,0 +1,208 @@
+"""Tests for scripts/evaluate_mcp.py."""
+
+import json
+import os
+import time
+
+import pytest
+
+import evaluate_mcp as em
+
+
+def shape(result: dict) -> "em.TestShape":
+    return em.TestShape.from_result(result)
+
+
+class TestStreamShape:
+    """Tests for the ijson-based _stream_shape function."""
+
+    pytestmark = pytest.mark.skipif(em.ijson is None, reason="ijson is not installed")
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "{}",
+            '{"a": 1, "b": "x", "c": null, "d": true, "e": 1.5}',
+            '{"items": [], "nested": {}}',
+            '{"items": [1, 2, 3], "count": 3}',
+            '{"items": [{"a": [1, 2]}, {"b": {"c": [3]}}], "next": "page2"}',
+            '{"matrix": [[1, 2], [], [[3]]], "deep": {"x": {"y": [1]}}}',
+            '{"mixed": [1, "two", null, [3], {"four": 4}, false]}',
+            '{"name": "caf\\u00e9 \\u2603", "emoji": "\\ud83d\\ude00"}',
+            '{"a": [1, 2], "a": 7}',
+            '{"a": 1, "a": [1, 2, 3]}',
+        ],
+    )
+    def test_matches_full_decode(self, text):
+        """Streamed shapes should equal shapes of the fully decoded payload."""
+        assert em._stream_shape(text.encode()) == shape(json.loads(text))
+
+    def test_large_payload_matches_full_decode(self):
+        """Payloads above the streaming threshold should match a full decode."""
+        result = {
+            "values": [{"id": i, "tags": ["a", "b"], "meta": {"n": [i]}} for i in range(20000)],
+            "size": 20000,
+        }
+        text = json.dumps(result, indent=2)
+        assert len(text) > em.STREAM_THRESHOLD
+        assert em._stream_shape(text.encode()) == shape(result)
+        assert em._text_shape(text) == shape(result)
+
+    @pytest.mark.parametrize("text", ["[1, 2]", "1", '"text"', "null"])
+    def test_returns_none_for_non_objects(self, text):
+        """Non-object payloads should fall back to the full decode."""
+        assert em._stream_shape(text.encode()) is None
+
+    @pytest.mark.parametrize("text", ["not json", '{"a": ', '{"a": 1} trailing'])
+    def test_returns_none_for_invalid_json(self, text):
+        """Invalid JSON should fall back to the full decode."""
+        assert em._stream_shape(text.encode()) is None
+
+    def test_returns_none_for_errors(self):
+        """Error payloads should fall back so the error value is kept."""
+        assert em._stream_shape(b'{"error": "Not found"}') is None
+
+
+class TestTextShape:
+    """Tests for _text_shape and _parse_text."""
+
+    def test_object_payload(self):
+        """JSON objects should be shaped directly."""
+        assert em._text_shape('{"a": [1, 2]}') == shape({"a": [1, 2]})
+
+    def test_plain_text_payload(self):
+        """Non-JSON text should be kept under a raw key."""
+        assert em._text_shape("Error executing tool") == shape({"raw": "Error executing tool"})
+
+    def test_non_object_payload(self):
+        """JSON that is not an object should be kept under a raw key."""
+        assert em._text_shape("[1, 2]") == shape({"raw": [1, 2]})
+
+    def test_error_payload(self):
+        """Error payloads should keep their error value."""
+        result = em._text_shape('{"error": "Not found"}')
+        assert result.has_error
+        assert result.error == "Not found"
+
+
+class TestCompareResults:
+    """Tests for compare_results function."""
+
+    def test_identical_results_match(self):
+        """Equal shapes should have no differences."""
+        assert em.compare_results(shape({"a": [1], "b": 1}), shape({"a": [2], "b": 2})) == []
+
+    def test_both_errors_match(self):
+        """Two errors should be considered a match."""
+        assert em.compare_results(shape({"error": "x"}), shape({"error": "y", "extra": 1})) == []
+
+    def test_python_error_only(self):
+        """A Python-only error should be reported."""
+        differences = em.compare_results(shape({"error": "x"}), shape({"error_free": 1}))
+        assert "Python returned error, TypeScript did not" in differences
+
+    def test_typescript_error_only(self):
+        """A TypeScript-only error should be reported."""
+        differences = em.compare_results(shape({"ok": 1}), shape({"error": "x"}))
+        assert "TypeScript returned error, Python did not" in differences
+
+    def test_missing_keys(self):
+        """Keys present on one side only should be reported per side."""
+        differences = em.compare_results(shape({"a": 1, "b": 1}), shape({"a": 1, "c": 1}))
+        assert sorted(differences) == [
+            "Keys missing in Python: {'c'}",
+            "Keys missing in TypeScript: {'b'}",
+        ]
+
+    def test_type_mismatch(self):
+        """Values of different types should be reported."""
+        differences = em.compare_results(shape({"a": 1}), shape({"a": "1"}))
+        assert differences == ["Type mismatch for 'a': Python=int, TypeScript=str"]
+
+    def test_list_against_dict(self):
+        """A list compared with a dict is a type mismatch, not a length difference."""
+        differences = em.compare_results(shape({"a": [1]}), shape({"a": {}}))
+        assert differences == ["Type mismatch for 'a': Python=list, TypeScript=dict"]
+
+    def test_array_length_differs(self):
+        """Arrays of different lengths should be reported."""
+        differences = em.compare_results(shape({"a": [1, 2]}), shape({"a": [1]}))
+        assert differences == ["Array 'a' length differs: Python=2, TypeScript=1"]
+
+    def test_default_ignored_keys(self):
+        """Timestamp keys should be ignored by default."""
+        py_result = shape({"a": 1, "updated_on": "x", "created_on": "y"})
+        assert em.compare_results(py_result, shape({"a": 1})) == []
+
+    def test_custom_ignored_keys(self):
+        """Custom ignore keys should replace the defaults."""
+        py_result = shape({"a": 1, "skip": 1, "updated_on": "x"})
+        differences = em.compare_results(py_result, shape({"a": "1"}), ignore_keys={"skip"})
+        assert sorted(differences) == [
+            "Keys missing in TypeScript: {'updated_on'}",
+            "Type mismatch for 'a': Python=int, TypeScript=str",
+        ]
+
+
+class TestResultCache:
+    """Tests for the ResultCache disk cache."""
+
+    RESPONSE = {"result": {"content": [{"type": "text", "text": '{"a": 1}'}]}}
+
+    def test_round_trip(self, tmp_path):
+        """Stored responses should be returned and counted as hits."""
+        cache = em.ResultCache(tmp_path / "cache")
+        cache.put("Python", "list_projects", {"limit": 5}, self.RESPONSE)
+        assert cache.get("Python", "list_projects", {"limit": 5}) == self.RESPONSE
+        assert cache.hits == 1
+
+    def test_miss(self, tmp_path):
+        """Unknown keys should miss without counting a hit."""
+        cache = em.ResultCache(tmp_path)
+        assert cache.get("Python", "list_projects", {}) is None
+        assert cache.hits == 0
+
+    def test_key_includes_server_tool_and_arguments(self, tmp_path):
+        """Entries should not leak across servers, tools or arguments."""
+        cache = em.ResultCache(tmp_path)
+        cache.put("Python", "list_projects", {"limit": 5}, self.RESPONSE)
+        assert cache.get("TypeScript", "list_projects", {"limit": 5}) is None
+        assert cache.get("Python", "list_branches", {"limit": 5}) is None
+        assert cache.get("Python", "list_projects", {"limit": 6}) is None
+
+    def test_argument_order_does_not_matter(self, tmp_path):
+        """Arguments should be keyed independently of their order."""
+        cache = em.ResultCache(tmp_path)
+        cache.put("Python", "list_commits", {"a": 1, "b": 2}, self.RESPONSE)
+        assert cache.get("Python", "list_commits", {"b": 2, "a": 1}) == self.RESPONSE
+
+    def test_expired_entries_miss(self, tmp_path):
+        """Entries older than max_age should not be returned."""
+        cache = em.ResultCache(tmp_path, max_age=60)
+        cache.put("Python", "list_projects", {}, self.RESPONSE)
+        old = time.time() - 120
+        for path in tmp_path.iterdir():
+            os.utime(path, (old, old))
+        assert cache.get("Python", "list_projects", {}) is None
+
+    def test_fingerprint_change_invalidates(self, tmp_path):
+        """Rebuilding a server should invalidate its entries only."""
+        cache = em.ResultCache(tmp_path, fingerprints={"Python": "1", "TypeScript": "1"})
+        cache.put("Python", "list_projects", {}, self.RESPONSE)
+        cache.put("TypeScript", "list_projects", {}, self.RESPONSE)
+        rebuilt = em.ResultCache(tmp_path, fingerprints={"Python": "2", "TypeScript": "1"})
+        assert rebuilt.get("Python", "list_projects", {}) is None
+        assert rebuilt.get("TypeScript", "list_projects", {}) == self.RESPONSE
+
+    def test_namespace_change_invalidates(self, tmp_path):
+        """A different workspace or cache version should not see old entries."""
+        em.ResultCache(tmp_path, namespace="ws|1").put("Python", "list_projects", {}, self.RESPONSE)
+        assert em.ResultCache(tmp_path, namespace="ws|2").get("Python", "list_projects", {}) is None
+
+    def test_corrupt_entry_misses(self, tmp_path):
+        """Unreadable entries should be treated as misses."""
+        cache = em.ResultCache(tmp_path)
+        cache.put("Python", "list_projects", {}, self.RESPONSE)
+        for path in tmp_path.iterdir():
+            path.write_bytes(b"{not json")
+        assert cache.get("Python", "list_projects", {}) is None